@@ -37,7 +37,7 @@ class Planner(object):
         self.device_context = device_context or {}
         self.load_strategy = load_strategy
         self.included_opts = included_opts
-        self.excluded_opts = excluded_opts or []
+        self.excluded_opts = set(excluded_opts) if excluded_opts else set()
         self.selected_algo = None
         self.basic_prune()
         self.stage = PlannerStage.BASIC_PRUNE
@@ -55,22 +55,21 @@ class Planner(object):
         for name, opt in self.opt_method_lib.methods.items():
             # prune based on sm_version(gpu_compute_capability)
             if opt.min_sm_version and gpu_compute_capability < float(opt.min_sm_version):
-                self.excluded_opts.append(name)
+                self.excluded_opts.add(name)
             # If node has no GPU, prune opt that only supports GPU
             elif not gpu_available and "cpu" not in opt.supported_devices:
-                self.excluded_opts.append(name)
+                self.excluded_opts.add(name)
             # If only has 1 process, prune opt that support distributed_only
             elif self.total_process == 1 and opt.distributed_only:
-                self.excluded_opts.append(name)
+                self.excluded_opts.add(name)
 
-        self.excluded_opts = list(set(self.excluded_opts))
         self.opt_method_lib.disable_opts(self.excluded_opts)
 
     def advance_prune(self):
         # prune opt methods using analyser result and baseline strategy results
         can_module_replace = self.analyser_result.get("has_module_for_replace")
         if not can_module_replace:
-            self.excluded_opts.append("module_replace")
+            self.excluded_opts.add("module_replace")
             self.opt_method_lib.disable_opts(["module_replace"])
 
     def generate_baseline_strategy(self):
@@ -12,6 +12,7 @@ from torch.distributed.distributed_c10d import _get_default_group
 from atorch.common.log_utils import default_logger as logger
 from atorch.common.util_func import find_free_port, get_ip_address, wait_for_server_started
 from atorch.utils.import_util import is_torch_npu_available
+from atorch.utils.version import torch_version
 
 _SP_NAME = "_ATORCH_SEQUENCE_PARALLEL"
 
@@ -667,6 +668,8 @@ def init_distributed(
     elastic_or_fault_tolerant=False,
     set_cuda_device_using_local_rank=False,
     timeout: timedelta = default_pg_timeout,
+    device_id=None,
+    store=None,
 ):
     """
     Initializes the distributed contexts. Support DDP.
@@ -698,6 +701,11 @@ def init_distributed(
             For ``ucc``, blocking wait is supported similar to NCCL. However,
             async error handling is done differently since with UCC we have
             progress thread and not watch-dog thread.
+        device_id (torch.device, optional): If not None, bind the default process group
+            to this device so that the NCCL communicator is created eagerly and sub-groups
+            can be created with ``ncclCommSplit``. Only takes effect with torch >= 2.3.
+        store (torch.distributed.Store, optional): If not None, the key/value store used for
+            rendezvous instead of the TCPStore created from ``MASTER_ADDR``/``MASTER_PORT``.
     Return:
         True if initialized successfully. False otherwise.
     """
@@ -762,13 +770,20 @@ def init_distributed(
     else:
         ddp_group_size = world_size() - coworker_size()
         if rank() < ddp_group_size:
-            # init with init_process_group using env
+            # init with init_process_group using env, or the given store
+            pg_kwargs = {}
+            if device_id is not None and backend == "nccl" and torch_version() >= (2, 3, 0):  # type: ignore
+                pg_kwargs["device_id"] = device_id
+            if store is not None:
+                pg_kwargs["store"] = store
+            else:
+                pg_kwargs["init_method"] = "env://"
             torch.distributed.init_process_group(
                 backend,
-                init_method="env://",
                 world_size=ddp_group_size,
                 rank=rank(),
                 timeout=timeout,
+                **pg_kwargs,
             )
             if not torch.distributed.is_initialized():
                 logger.error("Failed to init_process_group")
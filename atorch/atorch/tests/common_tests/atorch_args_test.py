@@ -0,0 +1,68 @@
+import json
+import unittest
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import torch
+
+import atorch
+from atorch.trainer.atorch_args import AtorchArguments
+
+
+def _loss_func(input, output):
+    return output
+
+
+@dataclass
+class _CustomArguments(AtorchArguments):
+    custom_func: Optional[Callable] = field(default=None, metadata={"help": "A custom function."})
+
+
+class AtorchArgumentsTest(unittest.TestCase):
+    def test_invalid_max_shard_size(self):
+        with self.assertRaises(ValueError):
+            AtorchArguments(output_dir="/tmp/output_atorch_args", max_shard_size="10TB")
+
+    def test_invalid_dist_store(self):
+        with self.assertRaises(ValueError):
+            AtorchArguments(output_dir="/tmp/output_atorch_args", dist_store_backend="redis")
+        with self.assertRaises(ValueError):
+            AtorchArguments(output_dir="/tmp/output_atorch_args", dist_store_backend="file")
+
+
+@unittest.skipIf(not torch.cuda.is_available(), "Setting up AtorchArguments devices requires gpu.")
+class AtorchArgumentsToDictTest(unittest.TestCase):
+    def tearDown(self):
+        atorch.reset_distributed()
+        return super().tearDown()
+
+    def test_to_dict(self):
+        args = AtorchArguments(
+            output_dir="/tmp/output_atorch_args",
+            loss_func=_loss_func,
+            atorch_wrap_cls=[torch.nn.Linear, "LlamaDecoderLayer"],
+            debug="underflow_overflow",
+            excluded=["zero2", "amp_native"],
+        )
+        d = args.to_dict()
+        self.assertEqual(d["loss_func"], "_loss_func")
+        self.assertEqual(d["optim_func"], "AdamW")
+        self.assertIsNone(d["prepare_input"])
+        self.assertEqual(d["atorch_wrap_cls"], ("Linear", "LlamaDecoderLayer"))
+        self.assertEqual(d["debug"], ["underflow_overflow"])
+        self.assertEqual(d["excluded"], ["zero2", "amp_native"])
+        self.assertIsNone(d["included"])
+        json.loads(args.to_json_string())
+
+    def test_subclass_to_dict(self):
+        args = _CustomArguments(output_dir="/tmp/output_atorch_args", custom_func=_loss_func)
+        d = args.to_dict()
+        self.assertEqual(d["custom_func"], "_loss_func")
+        self.assertEqual(d["optim_func"], "AdamW")
+        self.assertIn("custom_func", _CustomArguments._CALLABLE_FIELDS)
+        AtorchArguments(output_dir="/tmp/output_atorch_args").to_dict()
+        self.assertNotIn("custom_func", AtorchArguments._CALLABLE_FIELDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
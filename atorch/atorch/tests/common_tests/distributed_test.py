@@ -2,6 +2,7 @@ import copy
 import os
 import subprocess
 import sys
+import tempfile
 import unittest
 from datetime import timedelta
 
@@ -131,6 +132,16 @@ class DistributedTest(unittest.TestCase):
         self.assertEqual(local_rank(), 0)
         reset_distributed()
 
+    def test_init_distributed_with_file_store(self):
+        backend = "nccl" if torch.cuda.is_available() else "gloo"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = dist.FileStore(os.path.join(tmp_dir, "store"), 1)
+            res = init_distributed(backend, store=store)
+            self.assertTrue(res)
+            self.assertEqual(world_size(), 1)
+            self.assertEqual(rank(), 0)
+            reset_distributed()
+
     def test_two_process_init_distributed(self):
         run_dist_code("test_basic_dist", nproc=2, use_launch=False)
 
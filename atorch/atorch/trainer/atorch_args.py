@@ -1,257 +1,339 @@
+import collections.abc
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import timedelta
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import torch
 from accelerate.state import PartialState
 from accelerate.utils.dataclasses import DistributedType
 from transformers.training_args_seq2seq import Seq2SeqTrainingArguments
-from transformers.utils import cached_property
+from transformers.utils.hub import convert_file_size_to_int
 
 import atorch
 from atorch.utils.trainer_utils import ATORCHSCHEDULER_NAMES, SCHEDULER_NAMES, AtorchSchedulerType
 
 logger = logging.getLogger(__name__)
 
+_ATORCH_SCHED_SET = frozenset(ATORCHSCHEDULER_NAMES)
+_ALL_SCHED_TUPLE = tuple(SCHEDULER_NAMES) + tuple(ATORCHSCHEDULER_NAMES)
+
+
+def _to_cls_tuple(name: str, value):
+    if value is None or isinstance(value, tuple):
+        return value
+    if isinstance(value, str):
+        return (value,)
+    try:
+        return tuple(value)
+    except TypeError:
+        raise ValueError(f"{name} has {type(value)} type, required tuple type.")
+
+
+def _type_contains(tp, predicate) -> bool:
+    """Whether the annotation `tp` or any of its nested type arguments satisfies `predicate`."""
+    if isinstance(tp, str) or tp is Any:
+        # Unresolved or untyped annotation, the field may hold anything.
+        return True
+    return predicate(tp) or any(_type_contains(arg, predicate) for arg in get_args(tp))
+
+
+def _is_callable_type(tp) -> bool:
+    return tp is collections.abc.Callable or get_origin(tp) is collections.abc.Callable
+
+
+def _is_enum_type(tp) -> bool:
+    return isinstance(tp, type) and issubclass(tp, Enum)
+
+
+_HELP = {
+    "save_load_by_streaming": "Accelerate save/load speed.",
+    "ignore_dryrun_on_load_strategy": "Whether to ignore dryrun when calling `auto_accelerate`.",
+    "atorch_parallel_mode": (
+        "Whether to use `parallel_mode` optimize in ATorch. (useful only when " "`use_auto_accelerate` is True)"
+    ),
+    "atorch_opt": "ATorch training optimization strategy. Support 'fsdp' and 'ddp'.",
+    "atorch_module_replace": "Whether to use `module_replace` optimize in ATorch.",
+    "save_base_model": "Whether to save base model. Useful only when `peft_type` field is passed.",
+    "use_atorch_dataloader": (
+        "Whether to use `auto_accelerate()` to wrap dataloader."
+        "If you want to use Trainer's get_train_dataloader(), set --use_atorch_dataloader False."
+    ),
+    "shuffle": "If `True` (default), dataloader will shuffle the data.",
+    "optim_func": (
+        "optim_func can be a pytorch built-in optimizer function or a user-defined function, with params and"
+        "optim_args as arguments. such as:"
+        "def optim_func(parameters, **optim_args):"
+        "    return optim.SGD(parameters, **optim_args)"
+        "The optimizer will be created by optim_func(model.parameters(), **optim_args). "
+        "Defaults to torch.optim.AdamW."
+    ),
+    "optim_args": 'A dict of arguments used for optim, such as: optim_args = {"lr": 0.01, "momentum": 0.9}',
+    "optim_param_func": "Function returns an optimizer's parameters if users want to specify per-parameter options.",
+    "loss_func": (
+        "loss function for loss calculation from model input and output, such as:"
+        "def loss_func(input, output):"
+        "    loss = nn.MSELoss()"
+        '    return loss(input["label"], output)'
+        "This function either returns a loss value, or a list/tuple with the first value as loss."
+    ),
+    "prepare_input": (
+        "This is a function taken data and device as arguments."
+        "Call this function on data generated from dataloader before model input."
+    ),
+    "model_input_format": (
+        "The format in which the input data is passed to the model."
+        "If model_input_format=None, data is passed to model by `model(data)`."
+        "If model_input_format='unpack_sequence', `model(*data)`."
+        "If model_input_format='unpack_dict', `model(**data)`."
+        "It is invalid to set `model_input_format`, which is legacy in AtorchTrainer."
+    ),
+    "distributed_sampler_cls": (
+        "if not None, custom distributed sampler with same interface as pytorch's DistributedSampler."
+    ),
+    "excluded": "A list of optimization method names, which should NOT be used.",
+    "included": "A list of optimization method names, which should NOT be used.",
+    "finetune_strategy": "If True and `load_strategy` is not None, finetune the loaded strategy.",
+    "save_strategy_to_file": "If not None, a file name for saving the acceleration strategy.",
+    "atorch_checkpoint_cls": (
+        "Tuple of module classes for gradient checkpointing. Applicable when --gradient_checkpointing is set."
+    ),
+    "use_default_data_collator": (
+        "Whether to use default data collator DataCollatorWithPadding which may decrease the speed of "
+        "data retrieval."
+    ),
+    "ignore_write_errors": "Whether to ignore write errors when writting to disk.",
+    "async_save": "Whether to use multiprocess to save model.",
+    "atorch_lr_scheduler_type": "The custom scheduler type to use.",
+    "dist_store_backend": (
+        "The key/value store used for the rendezvous of the default process group. Support 'tcp' and "
+        "'file'. 'tcp' uses the TCPStore created from MASTER_ADDR/MASTER_PORT, 'file' uses a FileStore "
+        "at `dist_store_file` on a filesystem shared by all nodes."
+    ),
+    "dist_store_file": (
+        "Path of the FileStore. Required when `dist_store_backend` is 'file'. When launched by torchrun, the path "
+        "is suffixed with TORCHELASTIC_RUN_ID and TORCHELASTIC_RESTART_COUNT so that each attempt uses a fresh "
+        "file. Otherwise the path must not be reused across launches."
+    ),
+    "atorch_wrap_cls": "Tuple of module classes to wrap with fsdp.",
+    "cpu_offload": "Whether to use cpu_offload",
+    "use_orig_params": "Whether to use_orig_params",
+    "wrap_trainable_outmost": "Whether to wrap_trainable_outmost",
+    "sync_module_states": "Whether to sync_module_states",
+    "limit_all_gathers": "Whether to limit_all_gathers",
+    "forward_prefetch": "Whether to forward_prefetch",
+    "skip_if_nonfinite": "Whether to skip if nonfinite.",
+    "max_shard_size": (
+        "The maximum size for a checkpoint before being sharded. " "Used on PreTrainedModel.save_pretrained()."
+    ),
+    "logit_names": "The list of keys in your dictionary of outputs that correspond to the logits.",
+    "logit_index": (
+        "If isinstance(model's output, Tuple) and logit_index>=0, "
+        "use the corresponding part of the output as the logits."
+    ),
+}
+
 
 @dataclass
 class AtorchArguments(Seq2SeqTrainingArguments):
+    # Names of the fields that may hold a `Callable` or an `Enum`, collected once per class by `_init_field_kinds`
+    # on the first `to_dict` call.
+    _CALLABLE_FIELDS: ClassVar[Optional[FrozenSet[str]]] = None
+    _ENUM_FIELDS: ClassVar[Optional[FrozenSet[str]]] = None
+
     # ATorch config
-    save_load_by_streaming: bool = field(default=False, metadata={"help": "Accelerate save/load speed."})
+    save_load_by_streaming: bool = field(default=False, metadata={"help": _HELP["save_load_by_streaming"]})
     ignore_dryrun_on_load_strategy: bool = field(
-        default=True, metadata={"help": "Whether to ignore dryrun when calling `auto_accelerate`."}
+        default=True, metadata={"help": _HELP["ignore_dryrun_on_load_strategy"]}
     )
-    atorch_parallel_mode: bool = field(
-        default=True,
-        metadata={
-            "help": (
-                "Whether to use `parallel_mode` optimize in ATorch. (useful only when " "`use_auto_accelerate` is True)"
-            )
-        },
-    )
-    atorch_opt: str = field(
-        default="fsdp", metadata={"help": "ATorch training optimization strategy. Support 'fsdp' and 'ddp'."}
-    )
-    atorch_module_replace: bool = field(
-        default=True, metadata={"help": "Whether to use `module_replace` optimize in ATorch."}
-    )
-    save_base_model: bool = field(
-        default=False, metadata={"help": "Whether to save base model. Useful only when `peft_type` field is passed."}
-    )
-    use_atorch_dataloader: bool = field(
-        default=True,
-        metadata={
-            "help": (
-                "Whether to use `auto_accelerate()` to wrap dataloader."
-                "If you want to use Trainer's get_train_dataloader(), set --use_atorch_dataloader False."
-            )
-        },
-    )
-    shuffle: bool = field(default=True, metadata={"help": "If `True` (default), dataloader will shuffle the data."})
+    atorch_parallel_mode: bool = field(default=True, metadata={"help": _HELP["atorch_parallel_mode"]})
+    atorch_opt: str = field(default="fsdp", metadata={"help": _HELP["atorch_opt"]})
+    atorch_module_replace: bool = field(default=True, metadata={"help": _HELP["atorch_module_replace"]})
+    save_base_model: bool = field(default=False, metadata={"help": _HELP["save_base_model"]})
+    use_atorch_dataloader: bool = field(default=True, metadata={"help": _HELP["use_atorch_dataloader"]})
+    shuffle: bool = field(default=True, metadata={"help": _HELP["shuffle"]})
     optim_func: Optional[Callable] = field(
-        default=torch.optim.AdamW,
-        metadata={
-            "help": (
-                "optim_func can be a pytorch built-in optimizer function or a user-defined function, with params and"
-                "optim_args as arguments. such as:"
-                "def optim_func(parameters, **optim_args):"
-                "    return optim.SGD(parameters, **optim_args)"
-                "The optimizer will be created by optim_func(model.parameters(), **optim_args)."
-            )
-        },
-    )
-    optim_args: Optional[Dict] = field(
-        default=None,
-        metadata={"help": 'A dict of arguments used for optim, such as: optim_args = {"lr": 0.01, "momentum": 0.9}'},
-    )
-    optim_param_func: Optional[Callable] = field(
-        default=None,
-        metadata={"help": "Function returns an optimizer's parameters if users want to specify per-parameter options."},
-    )
-    loss_func: Optional[Callable] = field(
-        default=None,
-        metadata={
-            "help": (
-                "loss function for loss calculation from model input and output, such as:"
-                "def loss_func(input, output):"
-                "    loss = nn.MSELoss()"
-                '    return loss(input["label"], output)'
-                "This function either returns a loss value, or a list/tuple with the first value as loss."
-            )
-        },
-    )
-    prepare_input: Optional[Callable] = field(
-        default=None,
-        metadata={
-            "help": (
-                "This is a function taken data and device as arguments."
-                "Call this function on data generated from dataloader before model input."
-            )
-        },
-    )
-    model_input_format: Optional[str] = field(
-        default=None,
-        metadata={
-            "help": (
-                "The format in which the input data is passed to the model."
-                "If model_input_format=None, data is passed to model by `model(data)`."
-                "If model_input_format='unpack_sequence', `model(*data)`."
-                "If model_input_format='unpack_dict', `model(**data)`."
-                "It is invalid to set `model_input_format`, which is legacy in AtorchTrainer."
-            )
-        },
+        default_factory=lambda: torch.optim.AdamW, metadata={"help": _HELP["optim_func"]}
     )
+    optim_args: Optional[Dict] = field(default=None, metadata={"help": _HELP["optim_args"]})
+    optim_param_func: Optional[Callable] = field(default=None, metadata={"help": _HELP["optim_param_func"]})
+    loss_func: Optional[Callable] = field(default=None, metadata={"help": _HELP["loss_func"]})
+    prepare_input: Optional[Callable] = field(default=None, metadata={"help": _HELP["prepare_input"]})
+    model_input_format: Optional[str] = field(default=None, metadata={"help": _HELP["model_input_format"]})
     distributed_sampler_cls: Optional[Callable] = field(
-        default=None,
-        metadata={
-            "help": "if not None, custom distributed sampler with same interface as pytorch's DistributedSampler."
-        },
-    )
-    excluded: Optional[List[str]] = field(
-        default=None, metadata={"help": "A list of optimization method names, which should NOT be used."}
-    )
-    included: Optional[List[str]] = field(
-        default=None, metadata={"help": "A list of optimization method names, which should NOT be used."}
-    )
-    finetune_strategy: bool = field(
-        default=False, metadata={"help": "If True and `load_strategy` is not None, finetune the loaded strategy."}
-    )
-    save_strategy_to_file: Optional[str] = field(
-        default=None, metadata={"help": "If not None, a file name for saving the acceleration strategy."}
+        default=None, metadata={"help": _HELP["distributed_sampler_cls"]}
     )
+    excluded: Optional[List[str]] = field(default=None, metadata={"help": _HELP["excluded"]})
+    included: Optional[List[str]] = field(default=None, metadata={"help": _HELP["included"]})
+    finetune_strategy: bool = field(default=False, metadata={"help": _HELP["finetune_strategy"]})
+    save_strategy_to_file: Optional[str] = field(default=None, metadata={"help": _HELP["save_strategy_to_file"]})
 
     atorch_checkpoint_cls: Optional[Tuple[Union[Callable, str]]] = field(
-        default=None,
-        metadata={
-            "help": (
-                "Tuple of module classes for gradient checkpointing. Applicable when --gradient_checkpointing is set."
-            )
-        },
+        default=None, metadata={"help": _HELP["atorch_checkpoint_cls"]}
     )
 
-    use_default_data_collator: bool = field(
-        default=False,
-        metadata={
-            "help": (
-                "Whether to use default data collator DataCollatorWithPadding which may decrease the speed of "
-                "data retrieval."
-            )
-        },
-    )
+    use_default_data_collator: bool = field(default=False, metadata={"help": _HELP["use_default_data_collator"]})
 
-    ignore_write_errors: bool = field(
-        default=False, metadata={"help": ("Whether to ignore write errors when writting to disk.")}
-    )
+    ignore_write_errors: bool = field(default=False, metadata={"help": _HELP["ignore_write_errors"]})
 
-    async_save: bool = field(default=False, metadata={"help": ("Whether to use multiprocess to save model.")})
+    async_save: bool = field(default=False, metadata={"help": _HELP["async_save"]})
 
     atorch_lr_scheduler_type: Optional[Union[AtorchSchedulerType, str]] = field(
-        default=None,
-        metadata={"help": "The custom scheduler type to use."},
+        default=None, metadata={"help": _HELP["atorch_lr_scheduler_type"]}
     )
 
+    dist_store_backend: str = field(default="tcp", metadata={"help": _HELP["dist_store_backend"]})
+    dist_store_file: Optional[str] = field(default=None, metadata={"help": _HELP["dist_store_file"]})
+
     # ATorch FSDP config
     atorch_wrap_cls: Optional[Tuple[Union[Callable, str]]] = field(
-        default=None, metadata={"help": "Tuple of module classes to wrap with fsdp."}
+        default=None, metadata={"help": _HELP["atorch_wrap_cls"]}
     )
-    cpu_offload: bool = field(default=False, metadata={"help": "Whether to use cpu_offload"})
-    use_orig_params: bool = field(default=True, metadata={"help": "Whether to use_orig_params"})
-    wrap_trainable_outmost: bool = field(default=False, metadata={"help": "Whether to wrap_trainable_outmost"})
-    sync_module_states: bool = field(default=True, metadata={"help": "Whether to sync_module_states"})
-    limit_all_gathers: bool = field(default=True, metadata={"help": "Whether to limit_all_gathers"})
-    forward_prefetch: bool = field(default=True, metadata={"help": "Whether to forward_prefetch"})
+    cpu_offload: bool = field(default=False, metadata={"help": _HELP["cpu_offload"]})
+    use_orig_params: bool = field(default=True, metadata={"help": _HELP["use_orig_params"]})
+    wrap_trainable_outmost: bool = field(default=False, metadata={"help": _HELP["wrap_trainable_outmost"]})
+    sync_module_states: bool = field(default=True, metadata={"help": _HELP["sync_module_states"]})
+    limit_all_gathers: bool = field(default=True, metadata={"help": _HELP["limit_all_gathers"]})
+    forward_prefetch: bool = field(default=True, metadata={"help": _HELP["forward_prefetch"]})
 
     # ATorch amp config
-    skip_if_nonfinite: bool = field(default=True, metadata={"help": ("Whether to skip if nonfinite.")})
+    skip_if_nonfinite: bool = field(default=True, metadata={"help": _HELP["skip_if_nonfinite"]})
 
     # Other config
-    max_shard_size: str = field(
-        default="10GB",
-        metadata={
-            "help": (
-                "The maximum size for a checkpoint before being sharded. " "Used on PreTrainedModel.save_pretrained()."
-            )
-        },
-    )
+    max_shard_size: str = field(default="10GB", metadata={"help": _HELP["max_shard_size"]})
 
-    logit_names: Optional[List[str]] = field(
-        default=None, metadata={"help": "The list of keys in your dictionary of outputs that correspond to the logits."}
-    )
-    logit_index: int = field(
-        default=-1,
-        metadata={
-            "help": (
-                "If isinstance(model's output, Tuple) and logit_index>=0, "
-                "use the corresponding part of the output as the logits."
-            )
-        },
-    )
+    logit_names: Optional[List[str]] = field(default=None, metadata={"help": _HELP["logit_names"]})
+    logit_index: int = field(default=-1, metadata={"help": _HELP["logit_index"]})
 
     @cached_property
     def _setup_devices(self) -> "torch.device":
         logger.info("PyTorch: setting up devices")
 
+        # Same default as `_check_env` in `atorch.init_distributed`, which may not have run yet.
+        device = torch.device("cuda", int(os.getenv("LOCAL_RANK") or 0))
+        # Bind the device before creating the process group so that NCCL communicator is created eagerly.
+        # Skip it if the device is already current, e.g. set by the launcher or a previous `AtorchArguments`.
+        if torch.cuda.current_device() != device.index:
+            torch.cuda.set_device(device)
+
         if not torch.distributed.is_initialized():
             atorch.init_distributed(
-                os.getenv("TORCH_DISTRIBUTED_BACKEND", "nccl"), timeout=timedelta(seconds=self.ddp_timeout)
+                os.getenv("TORCH_DISTRIBUTED_BACKEND", "nccl"),
+                timeout=timedelta(seconds=self.ddp_timeout),
+                device_id=device,
+                store=self._create_dist_store(),
             )
 
-        # Set distributed_state
-        self.distributed_state = PartialState(backend=self.ddp_backend, timeout=timedelta(seconds=self.ddp_timeout))
+        # PartialState reads the number of processes, process index and local process index from the initialized
+        # process group and `LOCAL_RANK`, so the job must be started by torchrun or the accelerate launcher.
+        # Reuse the backend of the default process group, which may have been initialized by the caller.
+        backend = torch.distributed.get_backend() if torch.distributed.is_initialized() else self.ddp_backend
+        self.distributed_state = PartialState(backend=backend, timeout=timedelta(seconds=self.ddp_timeout))
         self.distributed_state.distributed_type = DistributedType.MULTI_GPU
-        self.distributed_state.num_processes = torch.distributed.get_world_size()
-        self.distributed_state.process_index = torch.distributed.get_rank()
-        self.distributed_state.local_process_index = int(os.environ.get("LOCAL_RANK", -1))
-        self.distributed_state.device = torch.device("cuda", self.distributed_state.local_process_index)
+        self.distributed_state.device = device
 
         self._n_gpu = 1
-        device = self.distributed_state.device
-        torch.cuda.set_device(device)
         return device
 
+    def _create_dist_store(self) -> Optional[torch.distributed.Store]:
+        if self.dist_store_backend == "file":
+            # The store file is only removed when every process exits cleanly, so a crashed or restarted attempt
+            # leaves it behind. Suffix the path with the elastic run id and restart count, which torchrun sets, so
+            # that every attempt gets a fresh file instead of the stale keys of the previous one.
+            path = self.dist_store_file
+            for env in ("TORCHELASTIC_RUN_ID", "TORCHELASTIC_RESTART_COUNT"):
+                if os.getenv(env):
+                    path = f"{path}.{os.getenv(env)}"
+            return torch.distributed.FileStore(path, int(os.getenv("WORLD_SIZE") or 1))
+        return None
+
+    @classmethod
+    def _init_field_kinds(cls):
+        """Collects the names of the fields whose annotation may hold a `Callable` or an `Enum`."""
+        try:
+            type_hints = get_type_hints(cls)
+        except NameError:
+            type_hints = {}
+        init_fields = [(f.name, type_hints.get(f.name, f.type)) for f in fields(cls) if f.init]
+        cls._CALLABLE_FIELDS = frozenset(name for name, tp in init_fields if _type_contains(tp, _is_callable_type))
+        cls._ENUM_FIELDS = frozenset(name for name, tp in init_fields if _type_contains(tp, _is_enum_type))
+
     def to_dict(self):
         """
         Serializes this instance while replace `Enum` by their values and `Callable` by dictionaries (for JSON
         serialization support). It obfuscates the token values by removing their value.
         """
-        # filter out fields that are defined as field(init=False)
+        cls = type(self)
+        # Subclasses add their own fields, so the field kinds are collected per class on first use.
+        if cls.__dict__.get("_CALLABLE_FIELDS") is None:
+            cls._init_field_kinds()
+
         d = super().to_dict()
-        for k, v in d.items():
-            if isinstance(v, Callable):
+        for k in cls._CALLABLE_FIELDS & d.keys():
+            v = d[k]
+            # Most of these fields are left as None, skip them before any type dispatch.
+            if v is None:
+                continue
+            if callable(v):
                 d[k] = v.__name__ if hasattr(v, "__name__") else str(v)
-            elif isinstance(v, list) and len(v) > 0:
-                if isinstance(v[0], Enum):
-                    d[k] = [x.value for x in v]
-                elif isinstance(v[0], Callable):
-                    d[k] = [x.__name__ if hasattr(x, "__name__") else str(x) for x in v]
-            elif isinstance(v, tuple) and len(v) > 0 and isinstance(v[0], Callable):
-                v = [x.__name__ if hasattr(x, "__name__") else str(x) for x in v]
-                d[k] = tuple(v)
+            elif isinstance(v, (list, tuple)) and len(v) > 0 and callable(v[0]):
+                names = [x.__name__ if hasattr(x, "__name__") else str(x) for x in v]
+                d[k] = tuple(names) if isinstance(v, tuple) else names
+        for k in cls._ENUM_FIELDS & d.keys():
+            v = d[k]
+            if v is None:
+                continue
+            if isinstance(v, list) and len(v) > 0 and isinstance(v[0], Enum):
+                d[k] = [x.value for x in v]
         return d
 
     def __post_init__(self):
         # Check arguments in transformers.training_args.TrainingArguments
         if self.report_to is not None:
-            if self.report_to == "all" or self.report_to == ["all"]:
+            report_to = {self.report_to} if isinstance(self.report_to, str) else set(self.report_to)
+            if "all" in report_to:
                 logger.info("AtorchTrainer only support TensorBoard to report the results and logs.")
-            elif self.report_to != "tensorboard" and self.report_to != ["tensorboard"]:
+            elif not report_to <= {"tensorboard"}:
                 raise ValueError("AtorchTrainer only support TensorBoard to report the results and logs.")
 
-        # check lr_scheduler_type
-        if self.atorch_lr_scheduler_type is not None and self.atorch_lr_scheduler_type not in ATORCHSCHEDULER_NAMES:
+        # check lr_scheduler_type, enum members hash by name so compare with their values
+        scheduler_type = self.atorch_lr_scheduler_type
+        if isinstance(scheduler_type, Enum):
+            scheduler_type = scheduler_type.value
+        if scheduler_type is not None and scheduler_type not in _ATORCH_SCHED_SET:
             raise ValueError(
                 f"lr_scheduler_type={self.atorch_lr_scheduler_type} is invalid, please select one of "
-                f"{SCHEDULER_NAMES + ATORCHSCHEDULER_NAMES}."
+                f"{list(_ALL_SCHED_TUPLE)}."
             )
 
-        if self.atorch_wrap_cls is not None and not isinstance(self.atorch_wrap_cls, tuple):
-            raise ValueError(f"atorch_wrap_cls has {type(self.atorch_wrap_cls)} type, required tuple type.")
+        if self.dist_store_backend not in ("tcp", "file"):
+            raise ValueError(f"dist_store_backend={self.dist_store_backend} is invalid, support 'tcp' and 'file'.")
+        if self.dist_store_backend == "file" and self.dist_store_file is None:
+            raise ValueError("dist_store_file is required when dist_store_backend is 'file'.")
+
+        # Parse max_shard_size the same way as `PreTrainedModel.save_pretrained` so that an invalid value fails
+        # before training starts.
+        convert_file_size_to_int(self.max_shard_size)
 
-        if self.atorch_checkpoint_cls is not None and not isinstance(self.atorch_checkpoint_cls, tuple):
-            raise ValueError(f"atorch_checkpoint_cls has {type(self.atorch_checkpoint_cls)} type, required tuple type.")
+        # Normalize module classes to tuples, HfArgumentParser and programmatic callers may pass lists.
+        self.atorch_wrap_cls = _to_cls_tuple("atorch_wrap_cls", self.atorch_wrap_cls)
+        self.atorch_checkpoint_cls = _to_cls_tuple("atorch_checkpoint_cls", self.atorch_checkpoint_cls)
 
         if self.model_input_format is not None:
             logger.warning(
@@ -259,7 +341,7 @@ class AtorchArguments(Seq2SeqTrainingArguments):
                 "and will be deprecated in AtorchTrainer."
             )
 
-        Seq2SeqTrainingArguments.__post_init__(self)
+        super().__post_init__()
 
         if self.use_legacy_prediction_loop:
             logger.warning("`use_legacy_prediction_loop` is deprecated and does not have any effect.")